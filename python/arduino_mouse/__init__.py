@@ -3,8 +3,15 @@ Arduino Mouse Proxy - Control mouse movements via Arduino Leonardo.
 """
 
 from .client import ArduinoMouse
-from .curves import Curve
+from .curves import Curve, curve_table, ease, sample_curve
 from .protocol import ProtocolError
 
-__all__ = ["ArduinoMouse", "Curve", "ProtocolError"]
+__all__ = [
+    "ArduinoMouse",
+    "Curve",
+    "ProtocolError",
+    "curve_table",
+    "ease",
+    "sample_curve",
+]
 __version__ = "1.0.0"
@@ -2,20 +2,35 @@
 Arduino Mouse Proxy client for controlling mouse movements via Arduino Leonardo.
 """
 
+import asyncio
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import deque
+
 import serial
-from typing import Optional
+from typing import Iterable, Optional, Sequence
 
 from .curves import Curve
 from .protocol import (
     encode_move_command,
-    decode_response,
+    encode_move_batch,
     response_code_to_string,
     ProtocolError,
     ACK_OK,
     NAK_CHECKSUM,
+    PACKET_SIZE,
 )
 
 
+def _close_serial(ser: serial.Serial) -> None:
+    """Close a serial port if it is still open."""
+    if ser.is_open:
+        ser.close()
+
+
 class ArduinoMouse:
     """
     Client for controlling mouse movements through an Arduino Leonardo.
@@ -31,12 +46,20 @@ class ArduinoMouse:
     Or using context manager:
         with ArduinoMouse(port="/dev/ttyACM0") as mouse:
             mouse.move(dx=100, dy=-50, duration_ms=500)
+
+    On connect the port is switched to low-latency mode where the platform
+    supports it (Linux ASYNC_LOW_LATENCY, and the usb-serial latency_timer
+    for FTDI-style adapters). This avoids the driver coalescing small
+    packets, which otherwise adds up to ~16ms to every command round-trip.
     """
 
     DEFAULT_BAUDRATE = 115200
     DEFAULT_TIMEOUT_BUFFER_MS = 1000
     MAX_RETRIES = 1
 
+    # Valid curve values; Curve members hash and compare equal to their ints
+    _CURVE_VALUES = {int(c): int(c) for c in Curve}
+
     def __init__(
         self,
         port: str,
@@ -55,6 +78,14 @@ class ArduinoMouse:
         self.baudrate = baudrate
         self.timeout_buffer_ms = timeout_buffer_ms
         self._serial: Optional[serial.Serial] = None
+        self._fd: Optional[int] = None
+        self._finalizer: Optional[weakref.finalize] = None
+        self._last_timeout: Optional[float] = None
+        # Held for the whole command/ACK exchange of a move
+        self._lock = threading.Lock()
+        # Input may hold stale responses until the first command, and again
+        # after any failed command (e.g. a late ACK following a timeout)
+        self._stale_input = True
         self._connect()
 
     def _connect(self) -> None:
@@ -64,15 +95,85 @@ class ArduinoMouse:
                 port=self.port,
                 baudrate=self.baudrate,
                 timeout=1.0,
+                rtscts=False,
+                dsrdtr=False,
             )
         except serial.SerialException as e:
             raise ConnectionError(f"Failed to connect to Arduino on {self.port}: {e}")
 
+        # Close the port when this object is collected or at interpreter exit
+        self._finalizer = weakref.finalize(self, _close_serial, self._serial)
+
+        self._enable_low_latency()
+
+        # Raw descriptor for writes that bypass pyserial's Python wrapper
+        if sys.platform != "win32":
+            try:
+                self._fd = self._serial.fileno()
+            except (AttributeError, OSError, serial.SerialException):
+                self._fd = None
+
+    def _enable_low_latency(self) -> None:
+        """Best-effort reduction of USB-serial turnaround latency."""
+        try:
+            self._serial.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError, OSError):
+            pass  # Not supported by this platform or driver
+
+        latency_timer = os.path.join(
+            "/sys/bus/usb-serial/devices",
+            os.path.basename(os.path.realpath(self.port)),
+            "latency_timer",
+        )
+        try:
+            with open(latency_timer, "w") as f:
+                f.write("1")
+        except OSError:
+            pass  # Not a usb-serial adapter, or no permission
+
     def _ensure_connected(self) -> None:
         """Ensure serial connection is active."""
         if self._serial is None or not self._serial.is_open:
             raise ConnectionError("Not connected to Arduino")
 
+    def _write(self, data: bytes) -> None:
+        """Send data, writing straight to the descriptor when possible."""
+        if self._fd is not None:
+            try:
+                written = os.write(self._fd, data)
+            except BlockingIOError:
+                written = 0
+            except OSError as e:
+                # Match pyserial, which reports write errors this way
+                raise serial.SerialException(f"write failed: {e}")
+            if written == len(data):
+                return
+            data = data[written:]
+        self._serial.write(data)
+
+    def _read_exactly(self, n: int, timeout: float) -> bytes:
+        """
+        Read n bytes, retrying short reads until the deadline passes.
+
+        Returns fewer than n bytes only if the timeout expires.
+        """
+        deadline = time.monotonic() + timeout
+        self._set_timeout(timeout)
+        buf = bytearray(self._serial.read(n))
+        while len(buf) < n:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._set_timeout(remaining)
+            buf.extend(self._serial.read(n - len(buf)))
+        return bytes(buf)
+
+    def _set_timeout(self, timeout: float) -> None:
+        """Set the read timeout, skipping the port reconfiguration if unchanged."""
+        if timeout != self._last_timeout:
+            self._serial.timeout = timeout
+            self._last_timeout = timeout
+
     def move(
         self,
         dx: int,
@@ -100,54 +201,190 @@ class ArduinoMouse:
         self._ensure_connected()
 
         # Validate curve
-        if not isinstance(curve, Curve):
-            try:
-                curve = Curve(curve)
-            except ValueError:
-                raise ValueError(f"Invalid curve value: {curve}")
+        curve = self._validate_curve(curve)
 
         # Encode command
-        command = encode_move_command(dx, dy, duration_ms, int(curve))
+        command = encode_move_command(dx, dy, duration_ms, curve)
 
         # Calculate timeout
         timeout_seconds = (duration_ms + self.timeout_buffer_ms) / 1000.0
 
-        # Send with retry on checksum error
-        for attempt in range(self.MAX_RETRIES + 1):
-            # Clear any pending data
-            self._serial.reset_input_buffer()
+        # Serialize exchanges so concurrent callers cannot take each other's ACK
+        with self._lock:
+            # Send with retry on checksum error
+            for attempt in range(self.MAX_RETRIES + 1):
+                # Clear pending data only when it may hold stale responses
+                if attempt > 0 or self._stale_input:
+                    self._serial.reset_input_buffer()
+
+                # Until ACK_OK is read, any exit (timeout, error, interrupt) may
+                # leave a late response behind for the next command
+                self._stale_input = True
+
+                # Send command
+                self._write(command)
+
+                # Wait for response
+                response = self._read_exactly(1, timeout_seconds)
+
+                if len(response) == 0:
+                    raise TimeoutError(
+                        f"Arduino did not respond within {timeout_seconds:.1f}s"
+                    )
+
+                # _read_exactly(1, ...) returned exactly one byte
+                code = response[0]
 
-            # Send command
-            self._serial.write(command)
-            self._serial.flush()
+                if code == ACK_OK:
+                    self._stale_input = False
+                    return
 
-            # Wait for response
-            self._serial.timeout = timeout_seconds
-            response = self._serial.read(1)
+                # Handle errors
+                if code == NAK_CHECKSUM and attempt < self.MAX_RETRIES:
+                    continue  # Retry on checksum error
 
-            if len(response) == 0:
-                raise TimeoutError(
-                    f"Arduino did not respond within {timeout_seconds:.1f}s"
+                raise ProtocolError(
+                    f"Movement failed: {response_code_to_string(code)}"
                 )
 
-            success, code = decode_response(response)
+    async def move_async(
+        self,
+        dx: int,
+        dy: int,
+        duration_ms: int,
+        curve: Curve = Curve.LINEAR,
+    ) -> None:
+        """
+        Awaitable variant of move().
 
-            if success:
-                return
+        The blocking serial exchange runs in the event loop's default
+        executor, so other tasks keep running while the Arduino moves.
 
-            # Handle errors
-            if code == NAK_CHECKSUM and attempt < self.MAX_RETRIES:
-                continue  # Retry on checksum error
+        Cancelling the awaiting task (e.g. via asyncio.wait_for) does not
+        stop the move: it keeps running in the executor thread and holds
+        the port until its ACK arrives or it times out. Further moves on
+        this instance wait for it to finish.
 
-            raise ProtocolError(
-                f"Movement failed: {response_code_to_string(code)}"
-            )
+        Args and exceptions are the same as for move().
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.move, dx, dy, duration_ms, curve)
+
+    def move_sequence(
+        self,
+        moves: Iterable[Sequence[int]],
+        window: int = 1,
+    ) -> None:
+        """
+        Perform several relative moves back-to-back.
+
+        All moves are validated and encoded before anything is sent. Up to
+        ``window`` commands are kept in flight at once, so the next command
+        is already queued on the Arduino when the previous one completes.
+
+        The stock firmware interrupts a running movement when a new command
+        arrives (NAK 0x03), so ``window`` greater than 1 requires firmware
+        that queues commands. The default of 1 works with any firmware.
+
+        Args:
+            moves: Iterable of (dx, dy, duration_ms) or
+                (dx, dy, duration_ms, curve) tuples
+            window: Maximum number of unacknowledged commands
+
+        Raises:
+            ValueError: If any move has out-of-range parameters
+            ConnectionError: If serial connection is lost
+            TimeoutError: If Arduino doesn't respond in time
+            ProtocolError: If communication protocol fails
+        """
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+
+        self._ensure_connected()
+
+        # Encode everything up front so an invalid move sends nothing
+        dxs, dys, durations, curves = [], [], [], []
+        for dx, dy, duration_ms, *rest in moves:
+            if len(rest) > 1:
+                raise ValueError(
+                    "move must be (dx, dy, duration_ms[, curve]), "
+                    f"got {len(rest) + 3} values"
+                )
+            curve = self._validate_curve(rest[0] if rest else Curve.LINEAR)
+            dxs.append(dx)
+            dys.append(dy)
+            durations.append(duration_ms)
+            curves.append(curve)
+        packets = memoryview(encode_move_batch(dxs, dys, durations, curves))
+        pending = deque(
+            (packets[i * PACKET_SIZE:(i + 1) * PACKET_SIZE], duration_ms)
+            for i, duration_ms in enumerate(durations)
+        )
+
+        with self._lock:
+            if self._stale_input:
+                self._serial.reset_input_buffer()
+
+            # Cleared only once the last command is acknowledged, so any other
+            # exit leaves the input marked as possibly holding late responses
+            self._stale_input = True
+
+            in_flight = deque()
+            attempt = 0
+            while pending or in_flight:
+                # Fill the window
+                while pending and len(in_flight) < window:
+                    entry = pending.popleft()
+                    self._write(entry[0])
+                    in_flight.append(entry)
+
+                # Wait for the oldest command to complete
+                command, duration_ms = in_flight[0]
+                timeout_seconds = (duration_ms + self.timeout_buffer_ms) / 1000.0
+                response = self._read_exactly(1, timeout_seconds)
+
+                if len(response) == 0:
+                    raise TimeoutError(
+                        f"Arduino did not respond within {timeout_seconds:.1f}s"
+                    )
+
+                code = response[0]
+
+                if code == ACK_OK:
+                    in_flight.popleft()
+                    attempt = 0
+                    continue
+
+                # Only retry when nothing else is in flight, to preserve ordering
+                if (
+                    code == NAK_CHECKSUM
+                    and len(in_flight) == 1
+                    and attempt < self.MAX_RETRIES
+                ):
+                    attempt += 1
+                    pending.appendleft(in_flight.popleft())
+                    continue
+
+                raise ProtocolError(
+                    f"Movement failed: {response_code_to_string(code)}"
+                )
+
+            self._stale_input = False
+
+    @classmethod
+    def _validate_curve(cls, curve) -> int:
+        """Convert a curve value to its int code, raising ValueError if invalid."""
+        try:
+            return cls._CURVE_VALUES[curve]
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid curve value: {curve}")
 
     def close(self) -> None:
         """Close the serial connection."""
-        if self._serial is not None and self._serial.is_open:
-            self._serial.close()
-            self._serial = None
+        if self._finalizer is not None:
+            self._finalizer()
+        self._serial = None
+        self._fd = None
 
     def __enter__(self) -> "ArduinoMouse":
         """Context manager entry."""
@@ -156,7 +393,3 @@ class ArduinoMouse:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit."""
         self.close()
-
-    def __del__(self) -> None:
-        """Destructor to ensure connection is closed."""
-        self.close()
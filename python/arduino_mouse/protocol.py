@@ -2,8 +2,10 @@
 Serial protocol encoding/decoding for Arduino Mouse Proxy.
 """
 
+import functools
+import operator
 import struct
-from typing import Tuple
+from typing import Iterable, Tuple
 
 # Protocol constants
 START_BYTE = 0xAA
@@ -16,16 +18,52 @@ NAK_CHECKSUM = 0x01
 NAK_INVALID = 0x02
 NAK_INTERRUPTED = 0x03
 
+# Response messages indexed by response code
+_RESPONSE_MESSAGES = (
+    "Movement completed successfully",      # ACK_OK
+    "Checksum error",                       # NAK_CHECKSUM
+    "Invalid command",                      # NAK_INVALID
+    "Movement interrupted by new command",  # NAK_INTERRUPTED
+)
+
+# Packet layout without the trailing checksum: start, cmd, dx, dy, duration, curve
+_MOVE_STRUCT = struct.Struct('<BBhhHB')
+
 
 class ProtocolError(Exception):
     """Raised when protocol communication fails."""
     pass
 
 
+def _raise_range_error(dx: int, dy: int, duration_ms: int, curve: int) -> None:
+    """Raise TypeError or ValueError naming the first invalid move parameter."""
+    params = (("dx", dx), ("dy", dy), ("duration_ms", duration_ms), ("curve", curve))
+    for name, value in params:
+        try:
+            operator.index(value)
+        except TypeError:
+            raise TypeError(
+                f"{name} must be an integer, got {type(value).__name__}"
+            ) from None
+
+    if not -32768 <= dx <= 32767:
+        raise ValueError(f"dx must be in range [-32768, 32767], got {dx}")
+    if not -32768 <= dy <= 32767:
+        raise ValueError(f"dy must be in range [-32768, 32767], got {dy}")
+    if not 1 <= duration_ms <= 65535:
+        raise ValueError(f"duration_ms must be in range [1, 65535], got {duration_ms}")
+    raise ValueError(f"curve must be in range [0, 3], got {curve}")
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
 def encode_move_command(dx: int, dy: int, duration_ms: int, curve: int) -> bytes:
     """
     Encode a move command into bytes for serial transmission.
 
+    Results are memoized in a process-global LRU cache, so repeated moves
+    with identical arguments skip validation and packing. Use
+    ``encode_move_command.cache_clear()`` to release it.
+
     Args:
         dx: Horizontal movement in pixels (-32768 to 32767)
         dy: Vertical movement in pixels (-32768 to 32767)
@@ -34,25 +72,74 @@ def encode_move_command(dx: int, dy: int, duration_ms: int, curve: int) -> bytes
 
     Returns:
         10-byte command packet
+
+    Raises:
+        TypeError: If any argument is not an integer
+        ValueError: If any argument is out of range
     """
-    if not -32768 <= dx <= 32767:
-        raise ValueError(f"dx must be in range [-32768, 32767], got {dx}")
-    if not -32768 <= dy <= 32767:
-        raise ValueError(f"dy must be in range [-32768, 32767], got {dy}")
-    if not 1 <= duration_ms <= 65535:
-        raise ValueError(f"duration_ms must be in range [1, 65535], got {duration_ms}")
-    if not 0 <= curve <= 3:
-        raise ValueError(f"curve must be in range [0, 3], got {curve}")
+    # Any out-of-range field leaves bits set above its width
+    try:
+        invalid = (
+            ((dx + 32768) >> 16)
+            | ((dy + 32768) >> 16)
+            | ((duration_ms - 1) >> 16)
+            | (duration_ms >> 16)
+            | (curve >> 2)
+        )
+    except TypeError:
+        invalid = True  # Non-integer argument; reported by the cold path
+    if invalid:
+        _raise_range_error(dx, dy, duration_ms, curve)
 
     # Pack: start, cmd, dx (2 bytes LE), dy (2 bytes LE), duration (2 bytes LE), curve
-    packet = struct.pack('<BBhhHB', START_BYTE, CMD_MOVE, dx, dy, duration_ms, curve)
+    packet = bytearray(PACKET_SIZE)
+    _MOVE_STRUCT.pack_into(packet, 0, START_BYTE, CMD_MOVE, dx, dy, duration_ms, curve)
+
+    # XOR checksum: fold the packet as one integer so every byte lands in the
+    # low byte (the checksum slot is still zero, so it does not contribute)
+    w = int.from_bytes(packet, 'little')
+    w ^= w >> 64
+    w ^= w >> 32
+    w ^= w >> 16
+    w ^= w >> 8
+    packet[-1] = w & 0xFF
+
+    return bytes(packet)
+
+
+def encode_move_batch(
+    dx: Iterable[int],
+    dy: Iterable[int],
+    duration_ms: Iterable[int],
+    curve: Iterable[int],
+) -> bytes:
+    """
+    Encode several move commands into one contiguous buffer.
+
+    This is a convenience wrapper that joins the output of
+    encode_move_command for each set of arguments, without going through
+    its cache; packets are laid out back-to-back, PACKET_SIZE bytes each.
+
+    Args:
+        dx, dy, duration_ms, curve: Parallel iterables of equal length,
+            with the same ranges as encode_move_command
 
-    # Calculate XOR checksum
-    checksum = 0
-    for byte in packet:
-        checksum ^= byte
+    Returns:
+        Concatenated command packets
 
-    return packet + bytes([checksum])
+    Raises:
+        ValueError: If the inputs differ in length or any value is out of range
+    """
+    dx, dy, duration_ms, curve = list(dx), list(dy), list(duration_ms), list(curve)
+    if not len(dx) == len(dy) == len(duration_ms) == len(curve):
+        raise ValueError(
+            "dx, dy, duration_ms and curve must have the same length, got "
+            f"{len(dx)}, {len(dy)}, {len(duration_ms)} and {len(curve)}"
+        )
+    # Bypass the LRU cache: batch waypoints are mostly unique, so caching
+    # them only adds overhead and evicts entries that move() reuses
+    encode = encode_move_command.__wrapped__
+    return b"".join(map(encode, dx, dy, duration_ms, curve))
 
 
 def decode_response(response: bytes) -> Tuple[bool, int]:
@@ -75,10 +162,6 @@ def decode_response(response: bytes) -> Tuple[bool, int]:
 
 def response_code_to_string(code: int) -> str:
     """Convert response code to human-readable string."""
-    messages = {
-        ACK_OK: "Movement completed successfully",
-        NAK_CHECKSUM: "Checksum error",
-        NAK_INVALID: "Invalid command",
-        NAK_INTERRUPTED: "Movement interrupted by new command",
-    }
-    return messages.get(code, f"Unknown response code: {code}")
+    if 0 <= code < len(_RESPONSE_MESSAGES):
+        return _RESPONSE_MESSAGES[code]
+    return f"Unknown response code: {code}"